@@ -10,13 +10,53 @@ Child classes inherit from NotationBase to get this base functionality.
 from typing import Union
 from typing import Pattern
 from typing import Any
+from functools import lru_cache
+from operator import attrgetter
 import json
-import yaml
+import os
 import re
-from .notation_dumper import NotationDumper
+import sys
+import warnings
 from .notation_representation import NotationRepresentation
 
 
+@lru_cache(maxsize=None)
+def _json_encoder(indent: int) -> json.JSONEncoder:
+    """
+    Build (once per indent) the encoder used for JSON output. This is the same
+    encoder `json.dumps(..., indent=indent)` would construct on every call.
+
+    Parameters:
+        indent (int): Spacing for pretty printing.
+
+    Returns:
+        json.JSONEncoder
+    """
+    return json.JSONEncoder(indent=indent)
+
+
+# the directory of the `pyhydrate` package, whose frames warnings skip
+_package_path: str = os.path.dirname(os.path.dirname(__file__)) + os.sep
+
+
+def _caller_stacklevel() -> int:
+    """
+    Get the `stacklevel`, for a warning raised by the function calling this
+    one, of the first frame outside of the package. The number of library
+    frames depends on the path taken, e.g. the root `PyHydrate` wrapper, a
+    child lookup, or an output property, so it can not be a constant.
+
+    Returns:
+        int
+    """
+    _level: int = 2
+    _frame = sys._getframe(2)
+    while _frame is not None and _frame.f_code.co_filename.startswith(_package_path):
+        _frame = _frame.f_back
+        _level += 1
+    return _level
+
+
 class NotationBase(NotationRepresentation):
     """
     Base Notation class with shared attributes and methods.
@@ -29,53 +69,74 @@ class NotationBase(NotationRepresentation):
         _raw_value (str): The original untouched value.
         _cleaned_value (str): The processed value after type checking.
         _hydrated_value (str): The wrapped Notation object.
-        _cast_pattern (Pattern[Any]): Regex raw string pattern for formatting
+        _cast_separators (frozenset): Characters that separate the words of
         object/dict keys.
         _kwargs (dict): Additional options passed during initialization.
         _depth (int): Recursion depth of wrapper class.
+        _debug_prefix (str): Indentation of debug output, based on the depth.
     """
 
     # TODO: add __int__, __bool__, and __float__ logic.
 
-    # CLASS CONSTANTS
-    _source_key: str = '__SOURCE_KEY__'
-    _cleaned_key: str = '__CLEANED_KEY__'
-    _hydrated_key: str = '__HYDRATED_KEY__'
+    # a tree creates one wrapper per node, so avoid a `__dict__` per instance
+    __slots__ = ('_raw_value', '_cleaned_value', '_hydrated_value', '_cleaned_type', '_cleaned_element',
+                 '_kind', '_yaml_cache', '_json_cache', '_kwargs', '_depth', '_debug', '_debug_prefix')
 
+    # CLASS CONSTANTS
     r'''
-    This regex uses lookaheads and lookbehinds to match 3 different cases:
-        - (?<!\d)(?=\d) - Matches positions that are preceded by a non-digit 
-                          and followed by a digit. This will match between a 
-                          non-digit and a digit character.
-        - (?<=\d)(?!\d) - Matches positions that are preceded by a digit and 
-                          followed by a non-digit. This will match between a 
-                          digit and a non-digit character.
-        - (?<=[a-z])(?=[A-Z]) - Matches positions that are preceded by a 
-                                lowercase letter and followed by an uppercase 
-                                letter. This will match between a lowercase 
-                                and uppercase letter.
-
-    So in summary, this regex will match:
-        - Between a non-digit and digit character
-        - Between a digit and non-digit character
-        - Between a lowercase and uppercase letter
-
-    It uses lookarounds to match the positions between the specified characters 
-    without including those characters in the match.
+    Keys are cast in a single scan of their characters, splitting words with
+    an underscore in 3 different cases:
+        - Between a non-digit and a digit character
+        - Between a digit and a non-digit character
+        - Between a lowercase and an uppercase letter
+
+    Kebab and space separators are swapped for underscores in the same scan,
+    and runs of underscores are collapsed into one as they are written.
     '''
-    _cast_pattern: Pattern[Any] = re.compile(r'(?<!\d)(?=\d)|(?<=\d)(?!\d)|(?<=[a-z])(?=[A-Z])')
-
-    # CLASS VARIABLES
-    _raw_value: Union[dict, list, None] = None
-    _cleaned_value: Union[dict, list, None] = None
-    _hydrated_value: Union[dict, list, None] = None
-    _kwargs: dict = {}
-    _depth: int = 1
+    _cast_separators: frozenset = frozenset('-_ ')
+
+    # keys that are already lower snake case, which casting leaves untouched
+    _snake_pattern: Pattern[Any] = re.compile(r'[a-z]+(?:_[a-z]+)*')
+
+    # the kind of the cleaned value, tagged once, and its debug output label
+    _kind_object: int = 0
+    _kind_array: int = 1
+    _kind_primitive: int = 2
+    _kind_labels: tuple = ('Object', 'Array', 'Primitive')
+
+    # the "call type" to the read-only property that answers it
+    _call_dispatch: dict = {
+        'value': attrgetter('_value'),
+        'element': attrgetter('_element'),
+        'type': attrgetter('_type'),
+        'depth': attrgetter('_depth'),
+        'map': attrgetter('_map'),
+        'json': attrgetter('_json'),
+        'yaml': attrgetter('_yaml'),
+    }
+    _call_options: str = ', '.join(_call_dispatch)
+
+    # INSTANCE VARIABLES
+    _raw_value: Union[dict, list, None]
+    _cleaned_value: Union[dict, list, None]
+    _hydrated_value: Union[dict, None]
+    _cleaned_type: type
+    _cleaned_element: Union[dict, None]
+    _kind: int
+    _yaml_cache: Union[str, None]
+    _json_cache: Union[str, None]
+    _kwargs: dict
+    _depth: int
+    _debug_prefix: str
 
     # INTERNAL METHODS
-    def _cast_key(self, string: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _cast_key(string: str) -> str:
         """
-        Format keys to be lowercase and underscore separated.
+        Format keys to be lowercase and underscore separated. The result only
+        depends on the key, so it is memoized; documents of the same shape
+        repeat the same keys over and over.
 
         Parameters:
             string (str): The object/dict key that is to be
@@ -84,44 +145,119 @@ class NotationBase(NotationRepresentation):
         Returns:
             str
         """
-        _kebab_clean: str = string.replace('-', '_').replace(' ', '_')
-        _parsed = self._cast_pattern.sub('_', _kebab_clean)
-        return re.sub(r'_+', r'_', _parsed).lower().strip('_')
+        # skip the scan when there is nothing to cast; keys are interned so that
+        # lookups by attribute name, which are interned too, match on identity,
+        # though `str` subclasses can not be interned and are returned as is
+        if NotationBase._snake_pattern.fullmatch(string):
+            return sys.intern(string) if type(string) is str else string
+
+        # the class of the previous character; 0 other, 1 digit, 2 lowercase
+        _separators: frozenset = NotationBase._cast_separators
+        _chars: list = []
+        _previous: int = 0
+        for _char in string:
+            if _char in _separators:
+                if _chars and _chars[-1] != '_':
+                    _chars.append('_')
+                _previous = 0
+                continue
+            if _char.isdecimal():
+                if _previous != 1 and _chars and _chars[-1] != '_':
+                    _chars.append('_')
+                _previous = 1
+            else:
+                if _previous == 1 or (_previous == 2 and 'A' <= _char <= 'Z'):
+                    _chars.append('_')
+                _previous = 2 if 'a' <= _char <= 'z' else 0
+            _chars.append(_char)
+        return sys.intern(''.join(_chars).lower().strip('_'))
+
+    @staticmethod
+    def _warn_unsupported(class_name: str, value: Any) -> None:
+        """
+        Warn that a value of an unsupported type was replaced with `None`. The
+        message is only built on this cold path, never for supported values,
+        and the warning points at the first caller outside of the package.
+
+        Parameters:
+            class_name (str): The Notation class that received the value.
+            value (Any): The unsupported value.
+
+        Returns:
+            None
+        """
+        _warning: str = (f"The `{class_name}` class does not support type '{type(value).__name__}'. "
+                         f"`None` value and `NoneType` returned instead.")
+        warnings.warn(_warning, stacklevel=_caller_stacklevel())
+
+    def _set_options(self, depth: int, options: dict) -> None:
+        """
+        Set the options and the depth. The options dict is shared by reference
+        with the parent, rather than unpacked into a new dict for every child.
 
-    def _print_debug(self, request: str, request_value: Union[str, int], stop: bool = False) -> None:
+        Parameters:
+            depth (int): The recursion depth of the parent.
+            options (dict): The options passed during initialization.
+
+        Returns:
+            None
+        """
+        self._kwargs = options
+        self._depth = depth + 1
+        self._debug = options.get('debug', False)
+        self._debug_prefix = '   ' * self._depth if self._debug else ''
+
+    def _set_value(self, raw_value: Any, cleaned_value: Any) -> None:
+        """
+        Set the raw and cleaned values, and cache the type and kind of the
+        cleaned value, as they are read on every call and debug print. The
+        element is built on its first request.
+
+        Parameters:
+            raw_value (Any): The original untouched value.
+            cleaned_value (Any): The processed value after type checking.
+
+        Returns:
+            None
+        """
+        self._raw_value = raw_value
+        self._cleaned_value = cleaned_value
+        self._cleaned_type = type(cleaned_value)
+        self._cleaned_element = None
+        if isinstance(cleaned_value, dict):
+            self._kind = self._kind_object
+        elif isinstance(cleaned_value, list):
+            self._kind = self._kind_array
+        else:
+            self._kind = self._kind_primitive
+        self._yaml_cache = None
+        self._json_cache = None
+        self._repr_cache = None
+
+    def _print_debug(self, request: str, request_value: Union[str, int]) -> None:
         """
-        Print debug info about the object.
+        Print debug info about the object. Callers check `_debug` first, so
+        nothing is called at all when debugging is off.
 
         Parameters:
             request (str): The request type that is trying to access the
             e.g. 'Call', 'Get', or 'Slice'.
             request_value (str, int): The attribute key or index slice
             used to access the underlying value.
-            stop (bool): Used to stop printing, even if `debug` is True.
-            Used primarily for internal purposes.
 
         Returns:
             None
         """
+        _component_type: str = self._kind_labels[self._kind]
+        _output: str = ''
 
-        _component_type: Union[str, None] = None
-        _output: Union[str, None] = None
-
-        if self._debug and not stop:
-            if self._type == dict:
-                _component_type = 'Object'
-                _output = ''
-            elif self._type == list:
-                _component_type = 'Array'
-                _output = ''
-            else:
-                _component_type = 'Primitive'
-                _output = f" :: Output == {self._value}"
+        if self._kind == self._kind_primitive:
+            _output = f" :: Output == {self._value}"
 
-            _print_value = (f"{'   ' * self._depth}>>> {_component_type} :: "
-                            f"{request} == {request_value} :: Depth == {self._depth}"
-                            f"{_output}")
-            print(_print_value)
+        _print_value = (f"{self._debug_prefix}>>> {_component_type} :: "
+                        f"{request} == {request_value} :: Depth == {self._depth}"
+                        f"{_output}")
+        print(_print_value)
 
     # MAGIC METHODS
     def __str__(self) -> str:
@@ -156,39 +292,27 @@ class NotationBase(NotationRepresentation):
         Returns:
             Union[dict, list, str, int, float, bool, type, None]
         """
-        #
-        _stop: bool = kwargs.get('stop', False)
-
-        # get the "call type" to return the correct result
-        try:
-            self._call = args[0]
-        # if no "call type" was provided, use `value`
-        except IndexError:
-            self._call = 'value'
-        finally:
-            # if no "call type" is None, also use `value`
-            if not self._call:
-                self._call = 'value'
-            self._print_debug('Call', self._call, _stop)
+        # get the "call type" to return the correct result, if no "call type"
+        # was provided, or it is None, use `value`
+        _call = args[0] if args else None
+        if not _call:
+            _call = 'value'
+        if self._debug:
+            self._print_debug('Call', _call)
+
+        # the default "call type" is read directly, without the dispatch table
+        if _call == 'value':
+            return self._value
 
         # based on the "call type", return the requested data
-        if self._call == 'value':
-            return self._value
-        elif self._call == 'element':
-            return self._element
-        elif self._call == 'type':
-            return self._type
-        elif self._call == 'depth':
-            return self._depth
-        elif self._call == 'map':
-            return self._map
-        elif self._call == 'json':
-            return self._json
-        elif self._call == 'yaml':
-            return self._yaml
-        else:
-            # TODO: load warnings of bad call
+        try:
+            _getter = self._call_dispatch[_call]
+        except (KeyError, TypeError):
+            # the valid options are joined once, only the invalid call type is formatted
+            warnings.warn(f"Call type '{_call}' is not valid. Valid options are: {self._call_options}.",
+                          stacklevel=_caller_stacklevel())
             return None
+        return _getter(self)
 
     # INTERNAL READ-ONLY PROPERTIES
     @property
@@ -200,7 +324,9 @@ class NotationBase(NotationRepresentation):
         Returns:
             dict {type: structure | primitive}
         """
-        return {self._type.__name__: self._value}
+        if self._cleaned_element is None:
+            self._cleaned_element = {self._cleaned_type.__name__: self._value}
+        return self._cleaned_element
 
     @property
     def _value(self) -> Union[dict, list, None]:
@@ -220,15 +346,16 @@ class NotationBase(NotationRepresentation):
         Returns:
             type
         """
-        return type(self._value)
+        return self._cleaned_type
 
     @property
-    def _map(self) -> Union[dict, list, None]:
+    def _map(self) -> Union[dict, None]:
         """
-        TBD
+        The translations from source object keys to cleaned keys. Only objects
+        have keys, so arrays and primitives have no map.
 
         Returns:
-            TBD
+            Union[dict, None]
         """
         return None
 
@@ -236,27 +363,64 @@ class NotationBase(NotationRepresentation):
     def _yaml(self) -> Union[str, None]:
         """
         Serialize the value to YAML format. Returns The YAML string if value is
-        dict/list, else the `element` value of the NotationPrimitive.
+        dict/list, else the `element` value of the NotationPrimitive. The string
+        is cached, as the cleaned value is not changed after it is set, and this
+        is the output of every `print()`.
 
         Returns:
             Union[str, None]
         """
-        if isinstance(self._value, dict) or isinstance(self._value, list):
-            return yaml.dump(self._value, sort_keys=False, Dumper=NotationDumper).rstrip()
+        if self._yaml_cache is not None:
+            return self._yaml_cache
+
+        # PyYAML is only imported once YAML output is actually requested
+        import yaml
+        from .notation_dumper import select_dumper
+        from .notation_dumper import emit_flat
+        from .notation_dumper import emit_scalar
+
+        _value = self._value
+
+        # primitives are written as their element, without building the element
+        if self._kind == self._kind_primitive:
+            _scalar = emit_scalar(_value)
+            if _scalar is not None and ' ' not in _scalar:
+                self._yaml_cache = f"{self._type.__name__}: {_scalar}"
+                return self._yaml_cache
+            _dumped = self._element
         else:
-            return yaml.dump(self._element, sort_keys=False, Dumper=NotationDumper).rstrip()
+            _dumped = _value
+
+        # flat objects are written directly, otherwise use PyYAML
+        _flat = emit_flat(_dumped) if type(_dumped) is dict else None
+        if _flat is not None:
+            self._yaml_cache = _flat
+        else:
+            self._yaml_cache = yaml.dump(_dumped, sort_keys=False, Dumper=select_dumper(_value)).rstrip()
+        return self._yaml_cache
         # TODO: handle None
 
     @property
     def _json(self) -> Union[str, None]:
         """
         Serialize the value to JSON format. Returns the JSON string if value is
-        dict/list, else None.
+        dict/list, else None. The string is cached, like the YAML string, as
+        the cleaned value is not changed after it is set.
 
         Returns:
             str
         """
-        return json.dumps(self._value, indent=self._indent)
+        if self._json_cache is not None:
+            return self._json_cache
+
+        # indentation only affects structures, and primitives encode much
+        # faster via the default (C accelerated) encoder
+        _value = self._value
+        if self._kind != self._kind_primitive:
+            self._json_cache = _json_encoder(self._indent).encode(_value)
+        else:
+            self._json_cache = json.dumps(_value)
+        return self._json_cache
         # TODO: handle None
 
 
@@ -3,9 +3,25 @@ Provides a custom YAML dumper for Notation structures.
 
 This module contains the NotationDumper class which is a subclass of
 yaml.Dumper. It overrides YAML indentation.
+
+When PyYAML is built with libyaml, the C emitter is used for any value
+whose output would be identical to NotationDumper, i.e. any value that
+does not contain a block sequence nested under a mapping key.
+
+The most common output, a primitive element or a flat object of simple
+scalars, is written directly by `emit_flat` without going through PyYAML.
 """
+from typing import Union
+from typing import Pattern
+from typing import Any
+import re
 import yaml
 
+try:
+    from yaml import CSafeDumper as _LibYamlDumper
+except ImportError:
+    _LibYamlDumper = None
+
 
 class NotationDumper(yaml.Dumper):
     """
@@ -26,5 +42,160 @@ class NotationDumper(yaml.Dumper):
         return super().increase_indent(flow=flow, indentless=False)
 
 
+# the libyaml emitter only understands these types, and it always emits
+# "indentless" sequences, so it can not be used when a list is nested in a dict
+_safe_types: frozenset = frozenset([str, int, float, bool, type(None)])
+
+# PyYAML writes keys wider than 122 characters as complex `?` keys, but libyaml
+# only does so past 128, so long keys are left to PyYAML
+_key_width: int = 100
+
+
+def _libyaml_string(value: str) -> bool:
+    """
+    Determine if the libyaml emitter writes a string exactly as PyYAML would.
+    It measures line width differently for escaped (non ASCII) text, and
+    writes an empty key inline rather than as a complex `?` key.
+
+    Parameters:
+        value (str): The key or value string.
+
+    Returns:
+        bool
+    """
+    return value != '' and value.isascii() and value.isprintable()
+
+
+def _libyaml_compatible(value: Union[dict, list, str, int, float, bool, None]) -> bool:
+    """
+    Determine if the libyaml emitter renders the value exactly as the
+    NotationDumper would.
+
+    Parameters:
+        value (dict, list, str, int, float, bool, None): The value to dump.
+
+    Returns:
+        bool
+    """
+    _stack: list = [value]
+    while _stack:
+        _item = _stack.pop()
+        _type = type(_item)
+        if _type is dict:
+            for _k, _v in _item.items():
+                if type(_k) not in _safe_types or (type(_v) is list and _v):
+                    return False
+                if type(_k) is str:
+                    if len(_k) > _key_width or not _libyaml_string(_k):
+                        return False
+                elif len(str(_k)) > _key_width:
+                    return False
+                _stack.append(_v)
+        elif _type is list:
+            _stack.extend(_item)
+        elif _type is str:
+            if not _libyaml_string(_item):
+                return False
+        elif _type not in _safe_types:
+            return False
+    return True
+
+
+def select_dumper(value: Union[dict, list, str, int, float, bool, None]) -> type:
+    """
+    Select the fastest dumper class that will produce the NotationDumper output.
+
+    Parameters:
+        value (dict, list, str, int, float, bool, None): The value to dump.
+
+    Returns:
+        type
+    """
+    if _LibYamlDumper is not None and _libyaml_compatible(value):
+        return _LibYamlDumper
+    return NotationDumper
+
+
+# plain (unquoted) strings that no YAML resolver would read back as another type,
+# limited to identifier-like words separated by single spaces
+_plain_pattern: Pattern[Any] = re.compile(r'[A-Za-z_][A-Za-z0-9_]*(?: [A-Za-z0-9_]+)*')
+_plain_reserved: frozenset = frozenset(['yes', 'no', 'true', 'false', 'on', 'off', 'null'])
+
+# floats that are represented by PyYAML with their plain `repr()`
+_float_pattern: Pattern[Any] = re.compile(r'-?[0-9]+\.[0-9]+')
+
+# PyYAML folds plain scalars on spaces past this width
+_line_width: int = 80
+
+
+def is_plain(value: str) -> bool:
+    """
+    Determine if a string is written, and read back by the YAML resolvers, as
+    the very same plain (unquoted) string.
+
+    Parameters:
+        value (str): The string to check.
+
+    Returns:
+        bool
+    """
+    return _plain_pattern.fullmatch(value) is not None and value.lower() not in _plain_reserved
+
+
+def emit_scalar(value: Union[str, int, float, bool, None]) -> Union[str, None]:
+    """
+    Write a scalar exactly as PyYAML would, if it is simple enough to do so.
+
+    Parameters:
+        value (str, int, float, bool, None): The scalar to write.
+
+    Returns:
+        Union[str, None]: The YAML scalar, or None if PyYAML is needed.
+    """
+    _type = type(value)
+    if _type is bool:
+        return 'true' if value else 'false'
+    elif _type is int:
+        return str(value)
+    elif value is None:
+        return 'null'
+    elif _type is float:
+        _repr = repr(value)
+        return _repr if _float_pattern.fullmatch(_repr) else None
+    elif _type is str:
+        if is_plain(value):
+            return value
+    return None
+
+
+def emit_flat(value: dict) -> Union[str, None]:
+    """
+    Write a non-empty dict of simple scalars, e.g. an element or a flat object,
+    as a YAML mapping without PyYAML's event, serializer, and emitter pipeline.
+
+    Parameters:
+        value (dict): The mapping to write.
+
+    Returns:
+        Union[str, None]: The YAML string, or None if PyYAML is needed.
+    """
+    if not value:
+        return None
+
+    _lines: list = []
+    for _k, _v in value.items():
+        if type(_k) is not str:
+            return None
+        _key = emit_scalar(_k)
+        _scalar = emit_scalar(_v)
+        if _key is None or _scalar is None:
+            return None
+        _line = f"{_key}: {_scalar}"
+        if len(_line) > _line_width:
+            return None
+        _lines.append(_line)
+    return '\n'.join(_lines)
+
+
 if __name__ == '__main__':
     pass
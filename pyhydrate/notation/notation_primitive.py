@@ -7,9 +7,8 @@ bool, and None so they can be handled consistently in Notation structures.
 It inherits from NotationBase to get common functionality.
 """
 from typing import Union
-from typing import List
+from typing import FrozenSet
 from typing_extensions import Self
-import warnings
 from .notation_base import NotationBase
 
 
@@ -28,18 +27,32 @@ class NotationPrimitive(NotationBase):
         - None
 
     Attributes:
-        _primitives (List[type]): Valid primitive types.
+        _primitives (FrozenSet[type]): Valid primitive types.
     """
+    __slots__ = ()
+
     # CLASS VARIABLES
-    _primitives: List[type] = [str, int, float, bool, type(None)]
+    _primitives: FrozenSet[type] = frozenset([str, int, float, bool, type(None)])
+
+    # the wrappers of `None` returned by failed access, shared by depth and debug
+    # mode, which are the only state that a wrapper of `None` depends on; only
+    # shallow depths are shared, so a chain of misses can not grow the cache
+    _missing: dict = {}
+    _missing_depth: int = 32
+
+    # the options of the shared wrappers, by debug mode, which never hold on to
+    # the options of the structure that first missed
+    _missing_options: tuple = ({'debug': False}, {'debug': True})
 
-    def __init__(self, value: Union[str, int, float, bool, None], depth: int, **kwargs) -> None:
+    def __init__(self, value: Union[str, int, float, bool, None], depth: int, options: Union[dict, None] = None,
+                 **kwargs) -> None:
         """
         Initialize with the primitive value to wrap.
 
         Args:
             value: The primitive value.
             depth: The recursion depth that is incremented on initialization.
+            options: The options shared with the parent, instead of kwargs.
             **kwargs: Additional options.
 
         Raises:
@@ -48,24 +61,41 @@ class NotationPrimitive(NotationBase):
         Returns:
             None
         """
-        # set the local kwargs variable
-        self._kwargs = kwargs
-
-        # set the inherited class variables
-        self._depth = depth + 1
-        self._debug = self._kwargs.get('debug', False)
+        # set the inherited class variables, sharing the options of the parent
+        self._set_options(depth, kwargs if options is None else options)
+        self._hydrated_value = None
 
         #
-        if type(value) in self._primitives:
-            self._raw_value = value
-            self._cleaned_value = value
+        if value is None or type(value) in self._primitives:
+            self._set_value(value, value)
         #
         else:
-            self._raw_value = None
-            self._cleaned_value = None
-            _warning: str = (f"The `{self.__class__.__name__}` class does not support type '{type(value).__name__}'. "
-                             f"`None` value and `NoneType` returned instead.")
-            warnings.warn(_warning)
+            self._set_value(None, None)
+            self._warn_unsupported(self.__class__.__name__, value)
+
+    @classmethod
+    def _none(cls, depth: int, options: dict) -> Self:
+        """
+        Get the shared wrapper of `None` for a failed access at the depth,
+        rather than building a new one on every miss. Past `_missing_depth`,
+        a new wrapper is built, and left to the garbage collector.
+
+        Parameters:
+            depth (int): The recursion depth of the parent.
+            options (dict): The options of the parent.
+
+        Returns:
+            NotationPrimitive(None)
+        """
+        _debug = bool(options.get('debug', False))
+        if depth >= cls._missing_depth:
+            return cls(None, depth, cls._missing_options[_debug])
+        _key = (depth, _debug)
+        _wrapper = cls._missing.get(_key)
+        if _wrapper is None:
+            _wrapper = cls(None, depth, cls._missing_options[_debug])
+            cls._missing[_key] = _wrapper
+        return _wrapper
 
     def __getattr__(self, key: str) -> Self:
         """
@@ -75,8 +105,12 @@ class NotationPrimitive(NotationBase):
         Returns:
             NotationPrimitive(None):
         """
-        self._print_debug('Get', key)
-        return NotationPrimitive(None, self._depth, **self._kwargs)
+        # protocol lookups, e.g. `__setstate__` on copy, are never document keys
+        if key[:2] == '__' == key[-2:]:
+            raise AttributeError(key)
+        if self._debug:
+            self._print_debug('Get', key)
+        return NotationPrimitive._none(self._depth, self._kwargs)
 
     def __getitem__(self, index) -> Self:
         """
@@ -86,8 +120,9 @@ class NotationPrimitive(NotationBase):
         Returns:
             NotationPrimitive(None):
         """
-        self._print_debug('Slice', index)
-        return NotationPrimitive(None, self._depth, **self._kwargs)
+        if self._debug:
+            self._print_debug('Slice', index)
+        return NotationPrimitive._none(self._depth, self._kwargs)
 
 
 if __name__ == '__main__':
@@ -27,8 +27,11 @@ class NotationRepresentation(object):
         _idk (str): Raw string value if real value is missing.
         _debug (bool): Whether to print debug statements - from kwargs.
         _indent (int): Spacing for pretty printing - from kwargs.
+        _repr_cache (str): The built representation, cached on the first `repr`.
     """
 
+    __slots__ = ('_repr_cache',)
+
     # CLASS CONSTANTS
     _repr_key: str = 'PyHydrate'
     _idk: str = r'¯\_(ツ)_/¯'
@@ -37,25 +40,31 @@ class NotationRepresentation(object):
     _debug: bool = False
     _indent: int = 3
 
-    def __repr__(self) -> str:
+    # INSTANCE VARIABLES
+    _repr_cache: Union[str, None]
+
+    # INTERNAL METHODS
+    def _build_repr(self) -> str:
         """
-        Implement customized `__repr__` formatting and representation.
+        Build the customized representation from the raw value.
 
         Returns:
             str
         """
 
-        # Try to get the raw value from the object
+        # Try to get the raw value from the object, bypassing `__getattr__`
+        # (which hydrates missing attributes) and supporting `__slots__`
         try:
-            _working_value: Union[str, None] = self.__dict__.get('_raw_value', None)
+            _working_value: Union[str, None] = object.__getattribute__(self, '_raw_value')
         except AttributeError:
-            return f"{self._repr_key}(None)"
+            _working_value = None
 
         # Try to get the raw value from withing the structure object
         # TODO: is this necessary?
         if not _working_value:
             try:
-                _working_value = self.__dict__.get('_structure').__dict__.get('_raw_value', None)
+                _structure = object.__getattribute__(self, '_structure')
+                _working_value = object.__getattribute__(_structure, '_raw_value')
             except AttributeError:
                 return f"{self._repr_key}(None)"
 
@@ -82,6 +91,20 @@ class NotationRepresentation(object):
         else:
             return f"{self._repr_key}(None)"
 
+    # MAGIC METHODS
+    def __repr__(self) -> str:
+        """
+        Implement customized `__repr__` formatting and representation. The
+        wrapped values are never mutated, so the representation is built once,
+        and cached, rather than dumped again on every call.
+
+        Returns:
+            str
+        """
+        if self._repr_cache is None:
+            self._repr_cache = self._build_repr()
+        return self._repr_cache
+
 
 if __name__ == '__main__':
     pass
@@ -13,7 +13,6 @@ from typing import Union
 from typing_extensions import Self
 from .notation_base import NotationBase
 from .notation_primitive import NotationPrimitive
-import warnings
 
 
 class NotationObject(NotationBase):
@@ -22,55 +21,98 @@ class NotationObject(NotationBase):
 
     NotationObject wraps a dict to provide access to child elements
     using attribute and item access. Children can be other objects,
-    arrays, or primitives.
+    arrays, or primitives, and are only hydrated once they are accessed.
+
+    Attributes:
+        _source_keys (dict): The cleaned keys mapped to the source keys, built on the first lookup.
+        _key_map (dict): The source keys mapped to the cleaned keys.
+        _reported (bool): If every unsupported value of the dict, and of its
+        nested dicts, has been warned about, so no path warns about one twice.
     """
 
-    def __init__(self, value: dict, depth: int, **kwargs) -> None:
+    __slots__ = ('_source_keys', '_key_map', '_reported')
+
+    def __init__(self, value: dict, depth: int, options: Union[dict, None] = None, **kwargs) -> None:
         """
         Initialize with the raw dict and recursion depth.
 
         Parameters:
             value (dict):
             depth (int):
+            options (dict): The options shared with the parent, instead of kwargs.
             kwargs (dict):
         """
 
-        # set the local kwargs variable
-        self._kwargs = kwargs
+        # set the inherited class variables, sharing the options of the parent
+        self._set_options(depth, kwargs if options is None else options)
 
-        # set the inherited class variables
-        self._depth = depth + 1
-        self._debug = self._kwargs.get('debug', False)
+        # children are hydrated, and cached, on first access; the cache itself is
+        # only allocated with the first child, see `__getattr__`
+        self._hydrated_value = None
+        self._key_map = None
+        self._reported = False
 
         if isinstance(value, dict):
-            self._raw_value = value
+            # the keys are only cast once a child is first looked up, see `__getattr__`
+            self._source_keys = None
+            self._set_value(value, value)
+            # the cleaned dict is only built once it is requested, see `_value`,
+            # and it is always a plain dict, even when the raw dict is a subclass
+            self._cleaned_value = None
+            self._cleaned_type = dict
+        else:
+            self._source_keys = {}
+            self._set_value(None, None)
+            self._warn_unsupported(self.__class__.__name__, value)
 
-            _cleaned: dict = {}
-            _hydrated: dict = {}
+    @classmethod
+    def _clean_value(cls, value: dict, warn: bool = True, hydrated: Union[dict, None] = None,
+                     source_keys: Union[dict, None] = None) -> dict:
+        """
+        Build the cleaned value of a dict, i.e. the keys of every nested dict
+        are cast to lower case snake. Arrays are kept as is, and unsupported
+        primitives are replaced with `None`, as the hydrated children would be.
 
-            for _k, _v in value.items():
-                _casted_key = self._cast_key(_k)
+        Parameters:
+            value (dict): The raw dict.
+            warn (bool): Warn about unsupported primitives, unless they were already.
+            hydrated (dict): The children of the dict that are already hydrated.
+            source_keys (dict): The cleaned keys mapped to the source keys of the dict.
 
-                if isinstance(_v, dict):
-                    _hydrated[_casted_key] = NotationObject(_v, self._depth, **kwargs)
-                    _cleaned[_casted_key] = _hydrated[_casted_key](stop=True)
+        Returns:
+            dict
+        """
+        # walk the nested dicts with a work list of (raw, cleaned, hydrated) entries
+        # rather than recursing, so there is no call frame per nested dict
+        _cleaned: dict = {}
+        _pending: list = [(value, _cleaned, hydrated)]
+        while _pending:
+            _raw, _target, _children = _pending.pop()
+            for _key, _casted_key, _v in zip(_raw, map(cls._cast_key, _raw), _raw.values()):
+                # hydrated children have already warned about their own values, so
+                # reuse their cleaned values, when they wrap this very source key
+                _child = _children.get(_casted_key) if _children else None
+                if _child is not None and source_keys.get(_casted_key) == _key:
+                    _target[_casted_key] = _child._value
+                    continue
+                # exact type checks first, json and yaml never produce subclasses
+                _type = type(_v)
+                if _type in NotationPrimitive._primitives or _type is list:
+                    _target[_casted_key] = _v
+                elif _type is dict or isinstance(_v, dict):
+                    _target[_casted_key] = {}
+                    _pending.append((_v, _target[_casted_key], None))
                 elif isinstance(_v, list):
-                    _hydrated[_casted_key] = NotationArray(_v, self._depth, **kwargs)
-                    _cleaned[_casted_key] = _hydrated[_casted_key](stop=True)
+                    _target[_casted_key] = _v
                 else:
-                    _hydrated[_casted_key] = NotationPrimitive(_v, self._depth, **kwargs)
-                    _cleaned[_casted_key] = _hydrated[_casted_key](stop=True)
-
-            self._cleaned_value = _cleaned
-            self._hydrated_value = _hydrated
-        else:
-            _warning: str = (f"The `{self.__class__.__name__}` class does not support type '{type(value).__name__}'. "
-                             f"`None` value and `NoneType` returned instead.")
-            warnings.warn(_warning)
+                    _target[_casted_key] = None
+                    if warn:
+                        cls._warn_unsupported(NotationPrimitive.__name__, _v)
+        return _cleaned
 
     def __getattr__(self, key: str) -> Union[Self, u'NotationArray', NotationPrimitive]:
         """
-         Get a child element by attribute name.
+         Get a child element by attribute name, hydrating it on first access.
 
          Parameters:
             key (str):
@@ -78,8 +120,29 @@ class NotationObject(NotationBase):
         Returns:
             Union[NotationObject, NotationArray, NotationPrimitive]
          """
-        self._print_debug('Get', key)
-        return self._hydrated_value.get(key, NotationPrimitive(None, self._depth, **self._kwargs))
+        # protocol lookups, e.g. `__setstate__` on copy, are never document keys
+        if key[:2] == '__' == key[-2:]:
+            raise AttributeError(key)
+        if self._debug:
+            self._print_debug('Get', key)
+        _cache = self._hydrated_value
+        _child = _cache.get(key) if _cache is not None else None
+        if _child is None:
+            # cast every key of the object in one pass over the memoized caster,
+            # on the first lookup, as many objects are only ever output whole
+            _source_keys = self._source_keys
+            if _source_keys is None:
+                _source_keys = self._source_keys = dict(zip(map(self._cast_key, self._raw_value),
+                                                            self._raw_value))
+            # only build the `None` wrapper on a miss
+            _source_key = _source_keys.get(key)
+            if _source_key is None:
+                return NotationPrimitive._none(self._depth, self._kwargs)
+            _child = _hydrate(self._raw_value[_source_key], self._depth, self._kwargs, not self._reported)
+            if _cache is None:
+                _cache = self._hydrated_value = {}
+            _cache[key] = _child
+        return _child
 
     def __getitem__(self, index: int) -> NotationPrimitive:
         """
@@ -91,8 +154,38 @@ class NotationObject(NotationBase):
         Returns:
             NotationPrimitive(None)
         """
-        self._print_debug('Slice', index)
-        return NotationPrimitive(None, self._depth, **self._kwargs)
+        if self._debug:
+            self._print_debug('Slice', index)
+        return NotationPrimitive._none(self._depth, self._kwargs)
+
+    # INTERNAL READ-ONLY PROPERTIES
+    @property
+    def _map(self) -> Union[dict, None]:
+        """
+        The translations from source keys to cleaned keys. It is built on the
+        first request, from the memoized key casts, and cached.
+
+        Returns:
+            Union[dict, None]
+        """
+        if self._key_map is None and self._raw_value is not None:
+            self._key_map = dict(zip(self._raw_value, map(self._cast_key, self._raw_value)))
+        return self._key_map
+
+    @property
+    def _value(self) -> Union[dict, None]:
+        """
+        The cleaned value, i.e. keys are converted to lower case snake. It is
+        built from the raw dict on the first request, and cached.
+
+        Returns:
+            Union[dict, None]
+        """
+        if self._cleaned_value is None and self._raw_value is not None:
+            self._cleaned_value = self._clean_value(self._raw_value, not self._reported,
+                                                    self._hydrated_value, self._source_keys)
+            self._reported = True
+        return self._cleaned_value
 
 
 class NotationArray(NotationBase):
@@ -101,44 +194,38 @@ class NotationArray(NotationBase):
 
     NotationArray wraps a list with nested object/array/primitive
     elements similarly to NotationObject.
+
+    Attributes:
+        _length (int): The length of the list, for bounds checking an index.
     """
 
-    def __init__(self, value: list, depth: int, **kwargs) -> None:
+    __slots__ = ('_length',)
+
+    def __init__(self, value: list, depth: int, options: Union[dict, None] = None, **kwargs) -> None:
         """
         Initialize with the raw list value.
 
         Parameters:
             value (list):
             depth (int):
+            options (dict): The options shared with the parent, instead of kwargs.
             kwargs (dict):
         """
 
-        # set the local kwargs variable
-        self._kwargs = kwargs
+        # set the inherited class variables, sharing the options of the parent
+        self._set_options(depth, kwargs if options is None else options)
 
-        # set the inherited class variables
-        self._depth = depth + 1
-        self._debug = self._kwargs.get('debug', False)
+        # children are hydrated, and cached by index, on first access; the cache
+        # itself is only allocated with the first child, see `__getitem__`
+        self._hydrated_value = None
 
         if isinstance(value, list):
-            self._raw_value = value
-            self._cleaned_value = value
-
-            _hydrated: list = []
-            for _k, _v in enumerate(value):
-                if isinstance(_v, dict):
-                    _hydrated.append(NotationObject(_v, self._depth, **self._kwargs))
-                elif isinstance(_v, list):
-                    _hydrated.append(NotationArray(_v, self._depth, **self._kwargs))
-                else:
-                    _hydrated.append(NotationPrimitive(_v, self._depth, **self._kwargs))
-
-            self._hydrated_value = _hydrated
+            self._set_value(value, value)
+            self._length = len(value)
         else:
-            # self._value = NotationValue(None)
-            _warning: str = (f"The `{self.__class__.__name__}` class does not support type '{type(value).__name__}'. "
-                             f"`None` value and `NoneType` returned instead.")
-            warnings.warn(_warning)
+            self._set_value(None, None)
+            self._length = 0
+            self._warn_unsupported(self.__class__.__name__, value)
 
     def __getattr__(self, key: str) -> NotationPrimitive:
         """
@@ -150,12 +237,16 @@ class NotationArray(NotationBase):
         Returns:
             NotationPrimitive
         """
-        self._print_debug('Get', key)
-        return NotationPrimitive(None, self._depth, **self._kwargs)
+        # protocol lookups, e.g. `__setstate__` on copy, are never document keys
+        if key[:2] == '__' == key[-2:]:
+            raise AttributeError(key)
+        if self._debug:
+            self._print_debug('Get', key)
+        return NotationPrimitive._none(self._depth, self._kwargs)
 
     def __getitem__(self, index: int) -> Union[NotationObject, Self, NotationPrimitive]:
         """
-        Get child element by index.
+        Get child element by index, hydrating it on first access.
 
         Parameters:
             index (int):
@@ -163,20 +254,74 @@ class NotationArray(NotationBase):
         Returns:
             Union[NotationObject, NotationArray, NotationPrimitive]
         """
-        self._print_debug('Slice', index)
+        if self._debug:
+            self._print_debug('Slice', index)
+
+        _index = index
+        _type = type(_index)
+        if _type is str and not _index.strip().lstrip('+-')[:1].isdecimal():
+            # strings that can not be numbers, e.g. 'invalid', are rejected without raising
+            return NotationPrimitive._none(self._depth, self._kwargs)
+        elif _type is not int:
+            # anything `int()` accepts, e.g. '1' or 1.0, is still a valid index
+            try:
+                _index = int(_index)
+            except (TypeError, ValueError, OverflowError):
+                return NotationPrimitive._none(self._depth, self._kwargs)
+
+        _length = self._length
+        if not -_length <= _index < _length:
+            return NotationPrimitive._none(self._depth, self._kwargs)
+
+        # the cache is sparse, so a negative index shares the slot of its positive one
+        if _index < 0:
+            _index += _length
+
+        _cache = self._hydrated_value
+        _child = _cache.get(_index) if _cache is not None else None
+        if _child is None:
+            _child = _hydrate(self._raw_value[_index], self._depth, self._kwargs)
+            if _cache is None:
+                _cache = self._hydrated_value = {}
+            _cache[_index] = _child
+        return _child
+
+
+# the structure classes, by the exact type of the value they wrap
+_hydrate_dispatch: dict = {dict: NotationObject, list: NotationArray}
+
+
+def _hydrate(value: Union[dict, list, str, int, float, bool, None], depth: int,
+             options: dict, warn: bool = True) -> Union[NotationObject, NotationArray, NotationPrimitive]:
+    """
+    Wrap a child value of a structure in its Notation class.
 
-        try:
-            return self._hydrated_value[int(index)]
-        except IndexError:
-            print('index error')
-            return NotationPrimitive(None, self._depth, **self._kwargs)
-        except TypeError:
-            print('type error')
-            return NotationPrimitive(None, self._depth, **self._kwargs)
-        except ValueError:
-            print('value error')
-            return NotationPrimitive(None, self._depth, **self._kwargs)
+    Parameters:
+        value (dict, list, str, int, float, bool, None): The raw child value.
+        depth (int): The recursion depth of the parent structure.
+        options (dict): The options of the parent structure.
+        warn (bool): Warn about unsupported primitives, unless the parent
+        object already did while building its cleaned value.
 
+    Returns:
+        Union[NotationObject, NotationArray, NotationPrimitive]
+    """
+    _class = _hydrate_dispatch.get(type(value))
+    if _class is None:
+        # subclasses of dict and list fall back to the isinstance checks
+        if isinstance(value, dict):
+            _class = NotationObject
+        elif isinstance(value, list):
+            _class = NotationArray
+        else:
+            _class = NotationPrimitive
+            if not warn and value is not None and type(value) not in NotationPrimitive._primitives:
+                # already reported, so wrap the `None` it is replaced with
+                value = None
+    _child = _class(value, depth, options)
+    if not warn and _class is NotationObject:
+        _child._reported = True
+    return _child
 
 if __name__ == '__main__':
     pass
@@ -1,80 +1,154 @@
 import json
+import re
 from json import JSONDecodeError
-import yaml
 from typing import Union
+from typing import Pattern
+from typing import Any
 from .notation import NotationPrimitive
 from .notation import NotationArray
 from .notation import NotationObject
 from .notation import NotationRepresentation
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 
 class PyHydrate(NotationRepresentation):
 
-    # CLASS VARIABLES
-    _root_type: Union[type, None] = None
-    _structure: Union[NotationArray, NotationObject, NotationPrimitive, None] = None
+    # the Notation wrappers are slotted, so the root is too
+    __slots__ = ('_debug', '_root_type', '_structure')
+
+    # CLASS CONSTANTS
+    # the first non-whitespace character of any document `json.loads` accepts
+    _json_starts: frozenset = frozenset('{["-0123456789tfnNI')
+    # orjson reads integers outside of 64 bits as floats, and any such integer
+    # has at least 19 digits, so documents with a run that long use `json`
+    _long_digits: Pattern[Any] = re.compile(r'[0-9]{19}')
+    # the Notation class for each exact root type
+    _root_dispatch: dict = {
+        dict: NotationObject,
+        list: NotationArray,
+        str: NotationPrimitive,
+        int: NotationPrimitive,
+        float: NotationPrimitive,
+        bool: NotationPrimitive,
+        type(None): NotationPrimitive,
+    }
+
+    # INSTANCE VARIABLES
+    _root_type: Union[type, None]
+    _structure: Union[NotationArray, NotationObject, NotationPrimitive, None]
 
     # INTERNAL METHODS
+    @staticmethod
+    def _load_json(string: str) -> Union[dict, list, str, int, float, bool, None]:
+        """
+        Parse a JSON string, with orjson when it is installed. The standard
+        library parser is still tried after orjson fails, as it also accepts
+        `NaN`, `Infinity`, and lone surrogates. Documents that may hold an
+        integer wider than 64 bits skip orjson, which would lose its precision.
+
+        Parameters:
+            string (str): The JSON document.
+
+        Raises:
+            JSONDecodeError: If the string is not JSON.
+
+        Returns:
+            Union[dict, list, str, int, float, bool, None]
+        """
+        if _orjson is not None and PyHydrate._long_digits.search(string) is None:
+            try:
+                return _orjson.loads(string)
+            except _orjson.JSONDecodeError:
+                pass
+        return json.loads(string)
+
     def _print_root(self):
-        if self._debug:
-            print(f">>> Root :: <{self.__class__.__name__}>")
+        print(f">>> Root :: <{self.__class__.__name__}>")
 
     # MAGIC METHODS
     def __init__(self, source_value: Union[dict, list, str, int, float, bool, None], **kwargs) -> None:
 
         #
         self._debug = kwargs.get('debug', False)
+        self._root_type = None
+        self._structure = None
+        self._repr_cache = None
 
-        # try to translate string to json, if we fail, just quit attempt
-        if isinstance(source_value, str):
+        # try to translate string to json, if we fail, just quit attempt; strings
+        # that can not start a json document go straight to yaml
+        if isinstance(source_value, str) and source_value.lstrip(' \t\n\r')[:1] in self._json_starts:
             try:
-                source_value = json.loads(source_value)
+                source_value = self._load_json(source_value)
             except JSONDecodeError:
                 pass
 
         # if we still have a string, try to translate as if it were yaml
         if isinstance(source_value, str):
-            source_value = yaml.safe_load(source_value)
+            # PyYAML is only imported once a non JSON string is provided
+            import yaml
+            from .notation.notation_dumper import is_plain
+            # the libyaml parser, when PyYAML is built with it, builds the same safe types,
+            # though it accepts some input the python parser rejects, e.g. trailing tabs
+            # ('tab\t' loads as 'tab'), and may raise a different error class for invalid
+            # input ('%x' raises a ScannerError rather than a ParserError)
+            try:
+                from yaml import CSafeLoader as _Loader
+            except ImportError:
+                from yaml import SafeLoader as _Loader
+            # plain words, e.g. 'hello world', load as themselves, so skip the parser
+            if not is_plain(source_value):
+                source_value = yaml.load(source_value, Loader=_Loader)
 
+        # exact types are dispatched on a single lookup, subclasses fall back to the isinstance checks
+        _type = type(source_value)
+        _class = self._root_dispatch.get(_type)
+        if _class is not None:
+            self._root_type = _type
+            self._structure = _class(source_value, 0, kwargs)
         #
-        if isinstance(source_value, dict):
+        elif isinstance(source_value, dict):
             self._root_type = dict
-            self._structure = NotationObject(source_value, 0, **kwargs)
+            self._structure = NotationObject(source_value, 0, kwargs)
         #
         elif isinstance(source_value, list):
             self._root_type = list
-            self._structure = NotationArray(source_value, 0, **kwargs)
+            self._structure = NotationArray(source_value, 0, kwargs)
         #
-        elif (isinstance(source_value, int) or isinstance(source_value, float)
-              or isinstance(source_value, bool) or isinstance(source_value, str)):
-            self._root_type = type(source_value)
-            self._structure = NotationPrimitive(source_value, 0, **kwargs)
-        #
-        elif isinstance(source_value, type(None)):
-            self._root_type = type(None)
-            self._structure = NotationPrimitive(None, 0, **kwargs)
+        elif isinstance(source_value, (int, float, str)):
+            self._root_type = _type
+            self._structure = NotationPrimitive(source_value, 0, kwargs)
         else:
             self._root_type = type(None)
             self._structure = None
 
     def __str__(self) -> str:
-        self._print_root()
+        if self._debug:
+            self._print_root()
         return self._structure('yaml')
 
     def __getattr__(self, key: str) -> Union[NotationArray, NotationObject, NotationPrimitive, None]:
-        self._print_root()
+        # protocol lookups, e.g. `__setstate__` on copy, are never document keys
+        if key[:2] == '__' == key[-2:]:
+            raise AttributeError(key)
+        if self._debug:
+            self._print_root()
         return getattr(self._structure, key)
 
     def __getitem__(self, index: Union[int, None]) -> Union[NotationArray, NotationObject, NotationPrimitive, None]:
-        self._print_root()
+        if self._debug:
+            self._print_root()
         return self._structure[index]
 
     def __call__(self, *args, **kwargs) -> Union[dict, list, str, int, float, bool, type, None]:
-        self._print_root()
-        try:
+        if self._debug:
+            self._print_root()
+        if args:
             return self._structure(args[0])
-        except IndexError:
-            return self._structure()
+        return self._structure()
 
 
 if __name__ == '__main__':
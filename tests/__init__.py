@@ -1 +1,23 @@
+from functools import lru_cache
+from pathlib import Path
+import json
+import pyhydrate as pyhy
 
+# resolved from this file, so the tests do not depend on the working directory
+_data_path: Path = Path(__file__).resolve().parent.parent / 'pyhydrate' / 'data'
+
+
+@lru_cache(maxsize=None)
+def hydrated_data(file_name: str) -> pyhy.PyHydrate:
+    """
+    Load and hydrate a test data file once, and share it across every test
+    module that reads the same file.
+
+    Parameters:
+        file_name (str): The name of the file in `pyhydrate/data`.
+
+    Returns:
+        PyHydrate
+    """
+    # read the bytes without leaving a file handle open, `json` detects the encoding
+    return pyhy.PyHydrate(json.loads(Path(_data_path, file_name).read_bytes()), debug=True)
@@ -1,29 +1,89 @@
 import unittest
-import json
+import copy
 import pyhydrate as pyhy
+from . import hydrated_data
 
 
 class CallMethods(unittest.TestCase):
 
-    _data = pyhy.PyHydrate(json.loads(open('./pyhydrate/data/basic-dict-get.json', 'r').read()), debug=True)
+    _data = hydrated_data('basic-dict-get.json')
 
-    def test_yaml_string(self):
+    # the expected outputs of the `level_3` object
+    _level_3_yaml = '''test_string: test string
+test_integer: 1
+test_float: 2.345
+test_bool: true'''
+    _level_3_json = '''{
+   "test_string": "test string",
+   "test_integer": 1,
+   "test_float": 2.345,
+   "test_bool": true
+}'''
+
+    @classmethod
+    def setUpClass(cls):
+        # separate the debug output of the class from the test runner output
         print('\n')
+
+    def test_yaml_string(self):
         self.assertEqual(self._data.level_one.level_two.level_3.test_integer('yaml'), 'int: 1')
 
+    def test_yaml_flat_object(self):
+        self.assertEqual(self._data.level_one.level_two.level_3('yaml'), self._level_3_yaml)
+
     def test_type(self):
-        print('\n')
         self.assertEqual(self._data.level_one.level_two.level_3.test_integer('type'), int)
 
     def test_json_string(self):
-        print('\n')
-        self.assertEqual(self._data.level_one.level_two.level_3('json'),
-                         '''{
-   "test_string": "test string",
-   "test_integer": 1,
-   "test_float": 2.345,
-   "test_bool": true
-}''')
+        self.assertEqual(self._data.level_one.level_two.level_3('json'), self._level_3_json)
+
+    def test_map(self):
+        self.assertEqual(self._data.level_one.level_two.level_3('map'),
+                         {'TestString': 'test_string', 'testInteger': 'test_integer',
+                          'test_Float': 'test_float', 'Test_BOOL': 'test_bool'})
+        self.assertEqual(self._data.level_one.level_two.level_3.test_integer('map'), None)
+
+    def test_invalid_call_type(self):
+        # the warning points at the caller, from a child and from the root
+        for _node in (self._data.level_one, self._data):
+            with self.assertWarns(UserWarning) as _context:
+                self.assertEqual(_node('not_a_call_type'), None)
+            self.assertEqual(_context.filename, __file__)
+
+    def test_copy(self):
+        _copy = copy.deepcopy(self._data.level_one.level_two.level_3)
+        self.assertEqual(_copy.test_integer(), 1)
+        self.assertEqual(_copy('type'), dict)
+
+    def test_yaml_non_ascii(self):
+        _data = pyhy.PyHydrate({'city': 'Zürich',
+                                'note': 'Café au lait, crème brûlée et pâtisseries — '
+                                        'très bon, vraiment délicieux'})
+        self.assertEqual(str(_data), 'city: "Z\\xFCrich"\n'
+                                     'note: "Caf\\xE9 au lait, cr\\xE8me br\\xFBl\\xE9e et p\\xE2tisseries '
+                                     '\\u2014 tr\\xE8s bon,\\\n'
+                                     '  \\ vraiment d\\xE9licieux"')
+
+    def test_yaml_empty_key(self):
+        self.assertEqual(str(pyhy.PyHydrate({'_': 1, 'b': {'c': 1}})), "? ''\n: 1\nb:\n  c: 1")
+
+    def test_yaml_long_key(self):
+        # keys past 122 characters are written as complex keys, libyaml only does so past 128
+        for _length in (100, 122, 123, 125, 128, 129):
+            _key = 'a' * _length
+            _complex = _length > 122
+            with self.subTest(length=_length):
+                self.assertEqual(str(pyhy.PyHydrate({_key: 1, 'b': 2})),
+                                 f"? {_key}\n: 1\nb: 2" if _complex else f"{_key}: 1\nb: 2")
+                self.assertEqual(str(pyhy.PyHydrate([{_key: 1}])),
+                                 f"- ? {_key}\n  : 1" if _complex else f"- {_key}: 1")
+
+    def test_slots(self):
+        _nodes = (self._data, self._data.level_one, self._data.level_one.level_two.level_3.test_integer,
+                  self._data.level_one.missing)
+        for _node in _nodes:
+            with self.subTest(node=_node.__class__.__name__):
+                self.assertFalse(hasattr(_node, '__dict__'))
 
 
 if __name__ == '__main__':
@@ -1,28 +1,55 @@
 import unittest
-import json
+from collections import OrderedDict
 import pyhydrate as pyhy
+from pyhydrate.notation import NotationPrimitive
+from . import hydrated_data
 
 
 class DictReadMethods(unittest.TestCase):
 
-    _data = pyhy.PyHydrate(json.loads(open('./pyhydrate/data/basic-dict-get.json', 'r').read()), debug=True)
+    _data = hydrated_data('basic-dict-get.json')
 
-    def test_string_lookup(self):
+    @classmethod
+    def setUpClass(cls):
+        # separate the debug output of the class from the test runner output
         print('\n')
+
+    def test_string_lookup(self):
         self.assertEqual(self._data.level_one.level_two.level_3.test_string(), 'test string')
 
     def test_integer_lookup(self):
-        print('\n')
         self.assertEqual(self._data.level_one.level_two.level_3.test_integer(), 1)
 
     def test_float_lookup(self):
-        print('\n')
         self.assertEqual(self._data.level_one.level_two.level_3.test_float(), 2.345)
 
     def test_bool_lookup(self):
-        print('\n')
         self.assertEqual(self._data.level_one.level_two.level_3.test_bool(), True)
 
+    def test_missing_lookup(self):
+        self.assertEqual(self._data.level_one.not_a_key.level_3(), None)
+        self.assertEqual(self._data.level_one.not_a_key('depth'), 3)
+        self.assertEqual(self._data.level_one.not_a_key.level_3('depth'), 4)
+
+    def test_missing_chain(self):
+        # a long chain of misses neither grows the shared cache nor keeps the options of the tree
+        _data = pyhy.PyHydrate({})
+        _node = _data
+        for _ in range(1000):
+            _node = _node.missing
+        self.assertEqual(_node('depth'), 1001)
+        self.assertLessEqual(len(NotationPrimitive._missing), 2 * NotationPrimitive._missing_depth)
+        _options = _data._structure._kwargs
+        self.assertTrue(all(_wrapper._kwargs is not _options for _wrapper in NotationPrimitive._missing.values()))
+
+    def test_dict_subclass(self):
+        # the cleaned value of a dict subclass is a plain dict, at the root and nested
+        _data = pyhy.PyHydrate(OrderedDict(Outer=OrderedDict(Inner=1)), debug=True)
+        for _node in (_data, _data.outer):
+            with self.subTest(depth=_node('depth')):
+                self.assertIs(_node('type'), dict)
+                self.assertEqual(list(_node('element')), ['dict'])
+
 
 if __name__ == '__main__':
     unittest.main()
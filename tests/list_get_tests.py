@@ -1,28 +1,39 @@
 import unittest
-import json
 import pyhydrate as pyhy
+from . import hydrated_data
 
 
 class DictReadMethods(unittest.TestCase):
 
-    _data = pyhy.PyHydrate(json.loads(open('./pyhydrate/data/basic-list-get.json', 'r').read()), debug=True)
+    _data = hydrated_data('basic-list-get.json')
 
-    def test_string_lookup(self):
+    @classmethod
+    def setUpClass(cls):
+        # separate the debug output of the class from the test runner output
         print('\n')
+
+    def test_string_lookup(self):
         self.assertEqual(' '.join(self._data[0]()), 'a set of strings')
 
     def test_integer_lookup(self):
-        print('\n')
         self.assertEqual(sum(self._data[1]()), 6)
 
     def test_float_lookup(self):
-        print('\n')
         self.assertEqual(self._data[2][3](), -10.9876)
 
     def test_bool_lookup(self):
-        print('\n')
         self.assertEqual(self._data[3][1](), False)
 
+    def test_index_boundaries(self):
+        # one hydration per length, with each length reported as its own case
+        for _length in (0, 1, 2, 100, 1000):
+            _data = pyhy.PyHydrate(list(range(_length)))
+            with self.subTest(length=_length):
+                self.assertEqual(_data[_length - 1](), _length - 1 if _length else None)
+                self.assertEqual(_data[-_length](), 0 if _length else None)
+                self.assertEqual(_data[_length](), None)
+                self.assertEqual(_data[-_length - 1](), None)
+
 
 if __name__ == '__main__':
     unittest.main()
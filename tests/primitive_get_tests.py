@@ -1,40 +1,59 @@
 import unittest
+import warnings
 import pyhydrate as pyhy
 
 
 class PrimitiveReadMethods(unittest.TestCase):
 
-    def test_string(self):
+    @classmethod
+    def setUpClass(cls):
+        # separate the debug output of the class from the test runner output
         print('\n')
-        _data = pyhy.PyHydrate('a string', debug=True)
-        self.assertEqual(_data(), 'a string')
 
-    def test_int(self):
-        print('\n')
-        _data = pyhy.PyHydrate(123, debug=True)
-        self.assertEqual(_data(), 123)
-
-    def test_float(self):
-        print('\n')
-        _data = pyhy.PyHydrate(456.7890, debug=True)
-        self.assertEqual(_data(), 456.7890)
-
-    def test_bool(self):
-        print('\n')
-        _data = pyhy.PyHydrate(True, debug=True)
-        self.assertEqual(_data(), True)
-
-    def test_none(self):
-        print('\n')
-        _data = pyhy.PyHydrate(None, debug=True)
-        self.assertEqual(_data(), None)
+    def test_scalars(self):
+        # one case per primitive type, with each reported as its own subTest
+        for _value, _type in (('a string', str), (123, int), (456.7890, float), (True, bool), (None, type(None))):
+            _data = pyhy.PyHydrate(_value, debug=True)
+            with self.subTest(type=_type.__name__):
+                self.assertEqual(_data(), _value)
+                self.assertIs(_data('type'), _type)
 
     def test_dict(self):
-        print('\n')
         _data = pyhy.PyHydrate({}, debug=True)
         self.assertEqual(_data('yaml'), '{}')
 
     def test_list(self):
-        print('\n')
         _data = pyhy.PyHydrate([], debug=True)
         self.assertEqual(_data('yaml'), '[]')
+
+    def test_wide_integers(self):
+        # integers outside of 64 bits keep their precision, with or without orjson
+        for _value in (123456789012345678901234567890, 18446744073709551616, -9223372036854775809):
+            _data = pyhy.PyHydrate(f'{{"id": {_value}}}', debug=True)
+            with self.subTest(value=_value):
+                self.assertEqual(_data.id(), _value)
+                self.assertIs(_data.id('type'), int)
+                self.assertEqual(_data('json'), f'{{\n   "id": {_value}\n}}')
+
+    def test_unsupported_type(self):
+        # the warning points at the caller, whichever library path replaced the value
+        _paths = (lambda _data: _data.a(), lambda _data: _data.b[0](), lambda _data: _data('value'))
+        for _path in _paths:
+            _data = pyhy.PyHydrate({'a': {1}, 'b': [{2}]}, debug=True)
+            with self.assertWarns(UserWarning) as _context:
+                _path(_data)
+            self.assertEqual(_context.filename, __file__)
+
+    def test_unsupported_type_warned_once(self):
+        # each unsupported value warns once, whether it is first hydrated or first cleaned
+        for _first, _second in ((lambda _data: _data.a(), lambda _data: _data('value')),
+                                (lambda _data: _data('json'), lambda _data: _data.a()),
+                                (lambda _data: _data.b.c(), lambda _data: str(_data))):
+            _data = pyhy.PyHydrate({'a': {1}, 'b': {'c': {2}}}, debug=True)
+            with warnings.catch_warnings(record=True) as _warnings:
+                warnings.simplefilter('always')
+                _first(_data)
+                _second(_data)
+                _data.b.c()
+                _data('yaml')
+            self.assertEqual(len(_warnings), 2)